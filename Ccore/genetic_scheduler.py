@@ -1,17 +1,23 @@
 # genetic_scheduler.py
 import random
-import pandas as pd
+from skill_registry import get_registry
+
+# Genes are registry skill ids; negative ids are non-skill slots
+REST, REVISION, PRACTICE = -1, -2, -3
+SLOT_LABELS = {REST: "Rest", REVISION: "Revision", PRACTICE: "Practice"}
 
 class GeneticScheduler:
-    def __init__(self, skills_to_learn, hours_per_day=2, days=7):
+    def __init__(self, skills_to_learn, hours_per_day=2, days=7, registry=None):
         """
         Genetic Algorithm for Study Schedule Optimization.
         Population: Set of different Weekly Schedules.
-        Gene: A specific time slot assigned to a subject.
+        Gene: A specific time slot assigned to a subject (skill id).
         """
-        self.skills = skills_to_learn
+        self.registry = registry or get_registry()
+        self.skills = list(skills_to_learn)
         if not self.skills:
-            self.skills = ["Revision", "Practice"] # Fallback
+            self.skills = [REVISION, PRACTICE] # Fallback
+        self.genes = self.skills + [REST]
         self.hours = hours_per_day
         self.days = days
         self.population_size = 20
@@ -24,7 +30,7 @@ class GeneticScheduler:
     def create_genome(self):
         """Create a random schedule (Chromosome)."""
         # Randomly fill slots with skills or 'Rest'
-        genome = [random.choice(self.skills + ['Rest']) for _ in range(self.total_slots)]
+        genome = [random.choice(self.genes) for _ in range(self.total_slots)]
         return genome
 
     def fitness(self, genome):
@@ -38,13 +44,13 @@ class GeneticScheduler:
         score = 100
         
         # Rule 1: Coverage
-        unique_subjects = set([g for g in genome if g != 'Rest'])
+        unique_subjects = set([g for g in genome if g != REST])
         coverage = len(unique_subjects) / len(self.skills) if self.skills else 0
         score += (coverage * 50)
 
         # Rule 2: Burnout Check (consecutive same subjects)
         for i in range(len(genome) - 1):
-            if genome[i] == genome[i+1] and genome[i] != 'Rest':
+            if genome[i] == genome[i+1] and genome[i] != REST:
                 score -= 5 # Penalty for monotony
 
         return score
@@ -60,7 +66,7 @@ class GeneticScheduler:
         """Randomly change a slot in the schedule."""
         for i in range(len(genome)):
             if random.random() < self.mutation_rate:
-                genome[i] = random.choice(self.skills + ['Rest'])
+                genome[i] = random.choice(self.genes)
         return genome
 
     def run_evolution(self):
@@ -92,8 +98,14 @@ class GeneticScheduler:
         # Return best schedule
         return population[0]
 
+    def gene_name(self, gene):
+        """UI edge: skill id -> skill name."""
+        return SLOT_LABELS[gene] if gene < 0 else self.registry.name(gene)
+
     def format_schedule(self, best_genome):
         """Converts the gene list into a readable Table (DataFrame)."""
+        import pandas as pd
+
         week_days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
         schedule_map = {}
         
@@ -102,7 +114,7 @@ class GeneticScheduler:
             daily_slots = []
             for _ in range(self.hours):
                 if slot_idx < len(best_genome):
-                    daily_slots.append(best_genome[slot_idx])
+                    daily_slots.append(self.gene_name(best_genome[slot_idx]))
                     slot_idx += 1
             schedule_map[day] = daily_slots
             
@@ -1,7 +1,4 @@
 # inference_engine.py
-import numpy as np
-import skfuzzy as fuzz
-from skfuzzy import control as ctrl
 
 class FuzzyEvaluator:
     def __init__(self):
@@ -9,6 +6,11 @@ class FuzzyEvaluator:
         Initializes the Fuzzy Inference System.
         Matches Course Requirement: Dealing with Uncertainty & Fuzzy Logic.
         """
+        # Heavy scientific stack is imported only when an evaluator is built
+        import numpy as np
+        import skfuzzy as fuzz
+        from skfuzzy import control as ctrl
+
         # 1. Define Fuzzy Variables (Antecedents & Consequents)
         # Universe of Discourse: Range of values
         self.skill_match = ctrl.Antecedent(np.arange(0, 101, 1), 'skill_match')
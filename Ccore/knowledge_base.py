@@ -1,13 +1,19 @@
 # knowledge_base.py
-import networkx as nx
+from skill_registry import get_registry
 
 class SkillOntology:
-    def __init__(self):
+    def __init__(self, registry=None):
+        import networkx as nx
+
         # Graph-based Knowledge Representation
         # Concept: Hierarchical Taxonomy (Parent -> Child relationships)
         self.graph = nx.DiGraph()
         self.build_knowledge_base()
 
+        # Same knowledge in id space: prerequisite bitmask per registry id
+        self.registry = registry or get_registry()
+        self.prerequisite_masks = self.compile_prerequisites()
+
     def build_knowledge_base(self):
         """
         Constructs the domain knowledge using a Directed Graph.
@@ -47,12 +53,32 @@ class SkillOntology:
 
         
 
+    def compile_prerequisites(self):
+        """
+        Every ontology node must exist in the skill registry.
+        Skills the graph does not mention (e.g. Git) simply have no prerequisites.
+        """
+        masks = [0] * len(self.registry)
+        for node in self.graph.nodes():
+            if node not in self.registry:
+                raise KeyError(f"Ontology node '{node}' is missing from the skill registry")
+            for parent in self.graph.predecessors(node):
+                masks[self.registry.id(node)] |= 1 << self.registry.id(parent)
+        return masks
+
     def get_prerequisites(self, skill):
         """
         Inference Rule: To learn a child skill, you ideally need the parent skill.
+        Skills the graph does not mention (e.g. Git) have no prerequisites.
         """
+        if skill not in self.graph:
+            return []
         return list(self.graph.predecessors(skill))
 
+    def get_prerequisite_mask(self, skill_id):
+        """Id-space version of get_prerequisites (bitmask over registry ids)."""
+        return self.prerequisite_masks[skill_id]
+
     def get_related_skills(self, skill):
         """
         Reasoning: Finds siblings (e.g., if you know React, Vue is related).
@@ -0,0 +1,199 @@
+# pattern_database.py
+import hashlib
+import json
+import os
+
+# Serialized tables live next to the ontology (knowledge_base.py)
+PATTERN_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pattern_db.json")
+
+# Each table has 2^n entries, so keep the per-role skill subset bounded
+MAX_PATTERN_SKILLS = 16
+
+INFINITY = float("inf")
+
+
+def ontology_fingerprint(kb, learning_costs):
+    """
+    Hash of everything the tables depend on.
+    If the skill registry (its id -> name list, not just its version number),
+    the ontology edges or the cost table change, stored tables are stale.
+    """
+    payload = json.dumps({
+        "registry": kb.registry.fingerprint,
+        "costs": sorted(learning_costs.items()),
+        "edges": sorted(kb.graph.edges()),
+    })
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def goal_key(goal_ids):
+    return "|".join(str(skill_id) for skill_id in sorted(set(goal_ids)))
+
+
+class PatternDatabase:
+    """
+    Pattern Database Heuristic (precomputed per target role).
+    For a role we only care about its goal skills plus their learnable
+    prerequisites (the 'pattern'). Over every subset of that pattern we store
+    the exact remaining cost to the goal, found by dynamic programming.
+    Prerequisites that are not learnable (e.g. 'Backend' category nodes) are
+    treated as satisfied, so the table is a relaxation -> admissible and
+    consistent, and exact whenever those prerequisites are already known.
+    Everything is in skill-id space; states are bitmasks over registry ids,
+    and learning_costs maps registry id -> cost.
+    """
+    def __init__(self, kb, learning_costs, path=PATTERN_DB_PATH):
+        self.kb = kb
+        self.registry = kb.registry
+        self.learning_costs = learning_costs
+        self.path = path
+        self.fingerprint = ontology_fingerprint(kb, learning_costs)
+        self.costs = dict(learning_costs)
+        self.tables = {}
+        self.load()
+
+    # --- Persistence ---
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        # Automatic invalidation: ignore tables built for another registry/ontology/costs
+        if data.get("fingerprint") == self.fingerprint:
+            self.tables = data.get("tables", {})
+
+    def save(self):
+        with open(self.path, "w") as f:
+            json.dump({"fingerprint": self.fingerprint, "tables": self.tables}, f)
+
+    def refresh(self):
+        """Drops in-memory tables if learning_costs or the ontology changed."""
+        current = ontology_fingerprint(self.kb, self.learning_costs)
+        if current != self.fingerprint:
+            self.fingerprint = current
+            self.costs = dict(self.learning_costs)
+            self.tables = {}
+
+    # --- Offline Precomputation ---
+    def precompute(self, roles):
+        """Builds (or rebuilds) the table for every role's goal skill ids and saves them."""
+        self.refresh()
+        for goal_ids in roles:
+            self.tables[goal_key(goal_ids)] = self.build_table(goal_ids)
+        self.save()
+
+    def table_for(self, goal_ids):
+        """Returns the table for a goal, building it on demand for unseen goals."""
+        self.refresh()
+        key = goal_key(goal_ids)
+        if key not in self.tables:
+            table = self.build_table(goal_ids)
+            if table is None:
+                return None
+            self.tables[key] = table
+        return self.tables[key]
+
+    def pattern_ids(self, goal_ids):
+        """Goal skills plus the closure of their learnable prerequisites."""
+        pattern = set()
+        frontier = list(goal_ids)
+        while frontier:
+            skill_id = frontier.pop()
+            if skill_id in pattern:
+                continue
+            pattern.add(skill_id)
+            for parent in self.registry.from_mask(self.kb.get_prerequisite_mask(skill_id)):
+                if parent in self.costs:
+                    frontier.append(parent)
+        return sorted(pattern)
+
+    def build_table(self, goal_ids):
+        """
+        Backward DP over the subset lattice of the pattern.
+        h[S] = 0 if S contains the goal, else min over learnable skill s:
+               cost(s) + h[S + s]
+        Supersets have larger bitmasks, so iterating masks downwards
+        guarantees every successor is already solved.
+        """
+        skill_ids = self.pattern_ids(goal_ids)
+        if len(skill_ids) > MAX_PATTERN_SKILLS:
+            return None
+        # Local bit positions inside the pattern (not registry ids)
+        local = {skill_id: 1 << i for i, skill_id in enumerate(skill_ids)}
+
+        goal_mask = 0
+        for skill_id in set(goal_ids):
+            goal_mask |= local[skill_id]
+
+        # (bit, cost, prerequisite mask) for every learnable skill in the pattern
+        actions = []
+        for skill_id in skill_ids:
+            if skill_id not in self.costs:
+                continue
+            prereq_mask = 0
+            for parent in self.registry.from_mask(self.kb.get_prerequisite_mask(skill_id)):
+                prereq_mask |= local.get(parent, 0)
+            actions.append((local[skill_id], self.costs[skill_id], prereq_mask))
+
+        size = 1 << len(skill_ids)
+        table = [INFINITY] * size
+        for mask in range(size - 1, -1, -1):
+            if mask & goal_mask == goal_mask:
+                table[mask] = 0
+                continue
+            best = INFINITY
+            for bit, cost, prereq_mask in actions:
+                if mask & bit or prereq_mask & mask != prereq_mask:
+                    continue
+                candidate = cost + table[mask | bit]
+                if candidate < best:
+                    best = candidate
+            table[mask] = best
+
+        return {"skill_ids": skill_ids, "h": table}
+
+    # --- Online Lookup ---
+    @staticmethod
+    def project(table, state_mask):
+        """Abstracts a full state bitmask down to a bitmask over the pattern."""
+        mask = 0
+        for i, skill_id in enumerate(table["skill_ids"]):
+            if state_mask >> skill_id & 1:
+                mask |= 1 << i
+        return mask
+
+    def lookup(self, table, state_mask):
+        return table["h"][self.project(table, state_mask)]
+
+    def is_exact_for(self, table, start_mask):
+        """
+        The relaxation only ignores non-learnable prerequisites. If the start
+        state already has all of them, the table is the true cost-to-goal.
+        """
+        for skill_id in table["skill_ids"]:
+            if skill_id not in self.costs or start_mask >> skill_id & 1:
+                continue
+            for parent in self.registry.from_mask(self.kb.get_prerequisite_mask(skill_id)):
+                if parent not in self.costs and not start_mask >> parent & 1:
+                    return False
+        return True
+
+
+# Offline step: python pattern_database.py
+if __name__ == "__main__":
+    from role_catalog import RoleCatalog
+    from search_agent import CareerPathPlanner
+
+    catalog = RoleCatalog()
+    planner = CareerPathPlanner()
+    planner.pattern_db.precompute(catalog.required_skill_ids(role) for role in catalog.role_names)
+    for role in catalog.role_names:
+        table = planner.pattern_db.table_for(catalog.required_skill_ids(role))
+        if table is None:
+            print(f"{role}: skipped (more than {MAX_PATTERN_SKILLS} pattern skills)")
+            continue
+        print(f"{role}: {len(table['skill_ids'])} pattern skills, {len(table['h'])} entries")
+    print(f"Saved to {planner.pattern_db.path}")
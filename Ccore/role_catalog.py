@@ -0,0 +1,110 @@
+# role_catalog.py
+import json
+import os
+# numpy is imported inside the methods that use it, so importing the
+# catalog (e.g. from app.py) does not pay for numpy until roles are compiled
+from skill_registry import get_registry
+
+# Default catalog file (ships next to the ontology)
+ROLE_CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "roles.json")
+
+
+class RoleCatalog:
+    """
+    Data-driven Goal States: target roles with weighted required skills.
+    The catalog is compiled into:
+    - a Role x Skill weight matrix (numpy, columns = skill registry ids), and
+    - an inverted index Skill -> Roles,
+    so best-fit scoring only touches roles sharing a skill with the candidate.
+    """
+    def __init__(self, path=ROLE_CATALOG_PATH, registry=None):
+        self.path = path
+        self.registry = registry or get_registry()
+        with open(path) as f:
+            data = json.load(f)
+        self.version = data.get("version", 1)
+        self.compile(data["roles"])
+
+    def compile(self, roles):
+        import numpy as np
+
+        self.role_names = []
+        self.role_index = {}
+        self.role_skills = []     # role id -> skill id array (Goal State vector, catalog order)
+
+        entries = []
+        for role in roles:
+            role_id = len(self.role_names)
+            self.role_names.append(role["name"])
+            self.role_index[role["name"]] = role_id
+            try:
+                skill_ids = self.registry.encode(role["skills"].keys())
+            except KeyError as e:
+                raise KeyError(f"Role '{role['name']}' uses skill {e} which is not in the skill registry")
+            self.role_skills.append(skill_ids)
+            for skill_id, weight in zip(skill_ids, role["skills"].values()):
+                entries.append((role_id, skill_id, float(weight)))
+
+        self.matrix = np.zeros((len(self.role_names), len(self.registry)), dtype=np.float32)
+        postings = [[] for _ in range(len(self.registry))]
+        for role_id, skill_id, weight in entries:
+            self.matrix[role_id, skill_id] = weight
+            postings[skill_id].append(role_id)
+
+        self.role_totals = self.matrix.sum(axis=1)
+        self.role_totals[self.role_totals == 0] = 1.0  # roles without skills never divide by 0
+        self.skill_to_roles = [np.array(ids, dtype=np.int32) for ids in postings]
+
+    def __len__(self):
+        return len(self.role_names)
+
+    def required_skill_ids(self, role_name):
+        """Goal State vector for the planner (skill id array, catalog order)."""
+        return self.role_skills[self.role_index[role_name]]
+
+    def required_skills(self, role_name):
+        """Same as required_skill_ids, but skill names (for the UI)."""
+        return self.registry.decode(self.required_skill_ids(role_name))
+
+    @staticmethod
+    def _skill_ids(candidate_ids):
+        import numpy as np
+
+        return np.unique(np.asarray(candidate_ids, dtype=np.int32))
+
+    def match_percent(self, role_name, candidate_ids):
+        """Weighted share (0-100) of a role's requirements the candidate (skill ids) already has."""
+        role_id = self.role_index[role_name]
+        skill_ids = self._skill_ids(candidate_ids)
+        matched = self.matrix[role_id, skill_ids].sum() if len(skill_ids) else 0.0
+        return float(matched / self.role_totals[role_id] * 100)
+
+    def best_fit_roles(self, candidate_ids, top_k=5):
+        """
+        Ranks roles by weighted skill match for this candidate (skill ids).
+        Only roles reachable through the inverted index are scored.
+        Returns: list of (role name, match percent), best first.
+        """
+        import numpy as np
+
+        skill_ids = self._skill_ids(candidate_ids)
+        if len(skill_ids) == 0:
+            return []
+
+        role_ids = np.unique(np.concatenate([self.skill_to_roles[i] for i in skill_ids]))
+        scores = self.matrix[np.ix_(role_ids, skill_ids)].sum(axis=1) / self.role_totals[role_ids]
+
+        if len(role_ids) > top_k:
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            top = np.arange(len(role_ids))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.role_names[role_ids[i]], round(float(scores[i]) * 100, 2)) for i in top]
+
+
+# Test run
+if __name__ == "__main__":
+    catalog = RoleCatalog()
+    print("Roles:", catalog.role_names)
+    candidate = catalog.registry.encode(["Python", "SQL", "Pandas"])
+    print("Best fit for [Python, SQL, Pandas]:", catalog.best_fit_roles(candidate))
@@ -0,0 +1,103 @@
+# skill_registry.py
+import hashlib
+import json
+import os
+from array import array
+
+# Canonical skill list (ships next to the ontology)
+SKILL_REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills.json")
+
+# Compact storage for skill id sequences ('H' = unsigned 16-bit)
+ID_TYPECODE = "H"
+
+
+class SkillRegistry:
+    """
+    Single source of truth for the skill universe.
+    Every skill (and every ontology category) has a stable integer id, so the
+    parser, ontology, planner and scheduler exchange compact id arrays / bitmasks
+    instead of strings. Names are only needed at the UI edge (encode / decode).
+    Ids are append-only: existing ids never change, and any edit bumps "version".
+    Anything persisted in id space should also check `fingerprint`, a hash of
+    the actual (id, name, kind) list, in case an edit forgot the version bump.
+    """
+    def __init__(self, path=SKILL_REGISTRY_PATH):
+        self.path = path
+        with open(path) as f:
+            data = json.load(f)
+        self.version = data["version"]
+
+        entries = sorted(data["skills"], key=lambda entry: entry["id"])
+        if [entry["id"] for entry in entries] != list(range(len(entries))):
+            raise ValueError(f"Skill ids in {path} must be unique and dense (0..n-1)")
+
+        self.names = [entry["name"] for entry in entries]
+        self.kinds = [entry.get("kind", "skill") for entry in entries]
+        self.index = {name: skill_id for skill_id, name in enumerate(self.names)}
+        if len(self.index) != len(self.names):
+            raise ValueError(f"Duplicate skill names in {path}")
+
+        payload = json.dumps([[skill_id, name, kind]
+                              for skill_id, (name, kind) in enumerate(zip(self.names, self.kinds))])
+        self.fingerprint = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def id(self, name):
+        return self.index[name]
+
+    def name(self, skill_id):
+        return self.names[skill_id]
+
+    def skill_ids(self):
+        """Ids of real skills (excludes ontology categories / roles)."""
+        return [skill_id for skill_id, kind in enumerate(self.kinds) if kind == "skill"]
+
+    # --- UI edge: names <-> ids ---
+    def encode(self, names):
+        """Skill names -> compact id array. Unknown names raise KeyError."""
+        return array(ID_TYPECODE, (self.index[name] for name in names))
+
+    def decode(self, skill_ids):
+        """Id array (or any iterable of ids) -> skill names."""
+        return [self.names[skill_id] for skill_id in skill_ids]
+
+    # --- Bitmask form (planner states) ---
+    @staticmethod
+    def to_mask(skill_ids):
+        mask = 0
+        for skill_id in skill_ids:
+            mask |= 1 << skill_id
+        return mask
+
+    @staticmethod
+    def from_mask(mask):
+        ids = array(ID_TYPECODE)
+        while mask:
+            low = mask & -mask
+            ids.append(low.bit_length() - 1)
+            mask ^= low
+        return ids
+
+
+_default_registry = None
+
+
+def get_registry():
+    """Process-wide registry loaded once from skills.json."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = SkillRegistry()
+    return _default_registry
+
+
+# Test run
+if __name__ == "__main__":
+    registry = get_registry()
+    ids = registry.encode(["Python", "SQL", "Git"])
+    print(f"Registry v{registry.version} ({registry.fingerprint}): {len(registry)} entries")
+    print("Encoded:", list(ids), "-> Decoded:", registry.decode(ids))
@@ -1,56 +1,79 @@
 # resume_parser.py
-import pdfplumber
-import spacy
 import re
+from array import array
+from skill_registry import get_registry, ID_TYPECODE
 
-# Load English tokenizer, tagger, parser and NER
-# Ensure you ran: python -m spacy download en_core_web_sm
-try:
-    nlp = spacy.load("en_core_web_sm")
-except:
-    print("Spacy model not found. Please run: python -m spacy download en_core_web_sm")
+# spaCy model is loaded on first use (or by warmup.warm_up), not at import time
+_nlp = None
+# Marks a failed load, so a missing model is reported once and not retried per resume
+_NLP_UNAVAILABLE = object()
+
+def get_nlp():
+    """
+    Loads the English tokenizer, tagger, parser and NER once per process.
+    Ensure you ran: python -m spacy download en_core_web_sm
+    Returns None if the model is not installed.
+    """
+    global _nlp
+    if _nlp is None:
+        import spacy
+        try:
+            _nlp = spacy.load("en_core_web_sm")
+        except:
+            print("Spacy model not found. Please run: python -m spacy download en_core_web_sm")
+            _nlp = _NLP_UNAVAILABLE
+    return None if _nlp is _NLP_UNAVAILABLE else _nlp
 
 class ResumeParser:
-    def __init__(self):
-        # Pre-defined list of skills to look for (In a real AI, this would be a massive database)
+    def __init__(self, registry=None):
+        # Skills to look for come from the shared skill registry (skills.json)
         # This acts as our "Pattern Matching" logic for Perception
-        self.known_skills = [
-            "Python", "Java", "C++", "HTML", "CSS", "JavaScript", "React", "Vue",
-            "Node.js", "Django", "Flask", "SQL", "MongoDB", "PostgreSQL",
-            "Machine Learning", "TensorFlow", "Keras", "Pandas", "NumPy",
-            "AWS", "Docker", "Git", "Communication", "Leadership"
+        self.registry = registry or get_registry()
+        skill_ids = self.registry.skill_ids()
+        self.known_skills = self.registry.decode(skill_ids)
+
+        # Regex ensures we match "Java" but not "JavaScript" when looking for "Java"
+        # \b denotes word boundary. Compiled once, not per resume.
+        self.skill_patterns = [
+            (skill_id, re.compile(r"\b" + re.escape(self.registry.name(skill_id).lower()) + r"\b"))
+            for skill_id in skill_ids
         ]
 
     def extract_text_from_pdf(self, pdf_file):
         """
         Raw Perception: Converts physical file bytes into string data.
         """
+        import pdfplumber
+
         text = ""
         with pdfplumber.open(pdf_file) as pdf:
             for page in pdf.pages:
                 text += page.extract_text() + "\n"
         return text
 
-    def extract_skills(self, text):
+    def extract_skill_ids(self, text):
         """
         Feature Extraction: Processing raw text to find specific 'State' variables (Skills).
         Uses NLP tokenization to match words against known skills.
+        Returns: compact array of registry skill ids.
         """
-        doc = nlp(text)
-        found_skills = set()
+        nlp = get_nlp()
+        doc = nlp(text) if nlp is not None else None
+        found_ids = array(ID_TYPECODE)
 
         # 1. Direct Phrase Matching (Simple & Fast)
         # We normalize text to lowercase for comparison
         text_lower = text.lower()
         
-        for skill in self.known_skills:
-            # Regex ensures we match "Java" but not "JavaScript" when looking for "Java"
-            # \b denotes word boundary
-            pattern = r"\b" + re.escape(skill.lower()) + r"\b"
-            if re.search(pattern, text_lower):
-                found_skills.add(skill)
+        for skill_id, pattern in self.skill_patterns:
+            if pattern.search(text_lower):
+                found_ids.append(skill_id)
 
-        return list(found_skills)
+        return found_ids
+
+    def extract_skills(self, text):
+        """Same as extract_skill_ids, but returns skill names (for the UI)."""
+        return self.registry.decode(self.extract_skill_ids(text))
 
     def get_experience_level(self, text):
         """
@@ -1,99 +1,319 @@
 # search_agent.py
 import heapq
+import time
+from array import array
 from knowledge_base import SkillOntology
+from pattern_database import PatternDatabase
+from skill_registry import ID_TYPECODE
 
 class CareerPathPlanner:
-    def __init__(self):
+    def __init__(self, use_pattern_db=True):
         self.kb = SkillOntology()
+        self.registry = self.kb.registry
         # Cost table: Estimated weeks to learn a skill
-        self.learning_costs = {
+        costs = {
             "HTML": 1, "CSS": 2, "JavaScript": 4, "React": 4, "Vue": 3,
             "Python": 4, "Django": 6, "Flask": 3, "SQL": 3, "MongoDB": 2,
             "Machine Learning": 8, "TensorFlow": 6, "Pandas": 2, "Git": 1
         }
+        # Kept in id space (registry id -> weeks), like every planner state
+        self.learning_costs = {self.registry.id(skill): cost for skill, cost in costs.items()}
+        # Precomputed exact cost-to-goal tables per target role (see pattern_database.py)
+        self.pattern_db = PatternDatabase(self.kb, self.learning_costs) if use_pattern_db else None
+        self.actions = self.compile_actions()
 
-    def heuristic(self, current_skills, goal_skills):
+    def heuristic(self, current_skills, goal_skills, table=None):
         """
-        Heuristic (h): Number of missing skills.
+        Heuristic (h): Pattern database lookup when a table is available,
+        otherwise the number of missing skills.
         Logic: The more skills missing, the farther we are from the goal.
         """
-        missing = [s for s in goal_skills if s not in current_skills]
-        return len(missing)
+        state = self.registry.to_mask(self._known_ids(current_skills))
+        goal = self.registry.to_mask(self._goal_ids(goal_skills))
+        return self._h(state, goal, table)
+
+    def _h(self, state, goal, table):
+        if table is not None:
+            return self.pattern_db.lookup(table, state)
+        return (goal & ~state).bit_count()
 
     def get_valid_next_skills(self, current_skills):
         """
         CSP Logic: Returns skills whose prerequisites are met.
         """
-        possible_moves = []
-        all_known_skills = self.learning_costs.keys()
-        
-        for skill in all_known_skills:
-            if skill in current_skills:
-                continue 
-            
-            prereqs = self.kb.get_prerequisites(skill)
-            if all(p in current_skills for p in prereqs):
-                possible_moves.append(skill)
-                
-        return possible_moves
+        state = self.registry.to_mask(self._known_ids(current_skills))
+        return [self.registry.name(skill_id) for skill_id, bit, cost, prereqs in self.actions
+                if not state & bit and prereqs & state == prereqs]
+
+    def compile_actions(self):
+        """
+        (skill id, bit, cost, prerequisite mask) for every learnable skill.
+        Built once in __init__; call again after editing learning_costs.
+        """
+        return [(skill_id, 1 << skill_id, cost, self.kb.get_prerequisite_mask(skill_id))
+                for skill_id, cost in self.learning_costs.items()]
+
+    # --- UI edge: skill names in, skill names out ---
+    def _known_ids(self, skills):
+        """
+        Current skills -> ids. Names outside the registry are ignored: no skill
+        requires them and they cannot be learned, so they never affect a plan.
+        """
+        return self.registry.encode(skill for skill in skills if skill in self.registry)
+
+    def _goal_ids(self, skills):
+        """Goal skills -> ids. A goal outside the registry could never be reached."""
+        unknown = [skill for skill in skills if skill not in self.registry]
+        if unknown:
+            raise ValueError(f"Goal skills not in the skill registry: {unknown}")
+        return self.registry.encode(skills)
 
     def plan_career_path(self, start_skills, goal_skills):
         """
-        A* Search with Explainability Trace.
+        A* Search with Explainability Trace (skill names).
         Returns: Path, Total Cost, and Reasoning Log.
         """
-        start_tuple = tuple(sorted(start_skills))
-        
+        path, cost, trace = self.plan_career_path_ids(self._known_ids(start_skills),
+                                                      self._goal_ids(goal_skills))
+        return self._decode_plan(path), cost, self._decode_trace(trace)
+
+    def plan_career_path_anytime(self, start_skills, goal_skills, **kwargs):
+        """Skill-name wrapper around plan_career_path_anytime_ids."""
+        path, cost, trace, bound = self.plan_career_path_anytime_ids(
+            self._known_ids(start_skills), self._goal_ids(goal_skills), **kwargs)
+        return self._decode_plan(path), cost, self._decode_trace(trace), bound
+
+    def _decode_plan(self, path):
+        return None if path is None else self.registry.decode(path)
+
+    def _decode_trace(self, trace):
+        for log in trace:
+            log["skills"] = self.registry.decode(log["skill_ids"])
+        return trace
+
+    # --- Id-native planning (states are bitmasks over registry ids) ---
+    def plan_career_path_ids(self, start_ids, goal_ids):
+        """
+        A* Search with Explainability Trace.
+        Returns: Path (skill id array), Total Cost, and Reasoning Log.
+        """
+        start = self.registry.to_mask(start_ids)
+        goal = self.registry.to_mask(goal_ids)
+        table = self.pattern_db.table_for(goal_ids) if self.pattern_db else None
+        if table is not None and self.pattern_db.is_exact_for(table, start):
+            # Table is the true cost-to-goal here: answer by lookup, no search needed
+            return self.plan_by_lookup(start, goal, table)
+
         open_set = []
-        initial_h = self.heuristic(start_skills, goal_skills)
+        initial_h = self._h(start, goal, table)
         
-        # Priority Queue stores: (f_score, g_score, current_skills_tuple, path)
-        heapq.heappush(open_set, (initial_h, 0, start_tuple, []))
+        # Priority Queue stores: (f_score, g_score, state_mask, path)
+        heapq.heappush(open_set, (initial_h, 0, start, []))
         
         visited = set()
-        visited.add(start_tuple)
+        visited.add(start)
 
         # Explainability: Log every step the AI takes
         search_trace = []
 
         while open_set:
-            f, g, current_skills, path = heapq.heappop(open_set)
-            current_skills_set = set(current_skills)
+            f, g, state, path = heapq.heappop(open_set)
+            known = self.registry.from_mask(state)
 
             # Log the decision
             search_trace.append({
                 "step_type": "Expanded Node",
-                "skills": list(current_skills),
+                "skill_ids": known,
                 "g_score": g,
                 "h_score": f - g, # derived from f = g + h
                 "f_score": f,
-                "message": f"Explored state with {len(current_skills)} skills. Cost so far: {g}"
+                "message": f"Explored state with {len(known)} skills. Cost so far: {g}"
             })
 
             # 1. Goal Test
-            missing_skills = [s for s in goal_skills if s not in current_skills_set]
-            if not missing_skills:
-                return path, g, search_trace # Return trace as well
-
-            # 2. Generate Successors
-            valid_next_skills = self.get_valid_next_skills(current_skills_set)
-            
-            for skill in valid_next_skills:
-                new_skills = list(current_skills) + [skill]
-                new_skills_set = set(new_skills)
-                new_skills_tuple = tuple(sorted(new_skills))
-                
-                if new_skills_tuple in visited:
+            if goal & ~state == 0:
+                return array(ID_TYPECODE, path), g, search_trace # Return trace as well
+
+            # 2. Generate Successors (CSP: prerequisites must be met)
+            for skill_id, bit, step_cost, prereqs in self.actions:
+                if state & bit or prereqs & state != prereqs:
+                    continue
+                new_state = state | bit
+                if new_state in visited:
                     continue
                 
-                step_cost = self.learning_costs.get(skill, 2)
                 new_g = g + step_cost
-                new_h = self.heuristic(new_skills_set, goal_skills)
+                new_h = self._h(new_state, goal, table)
+                if new_h == float("inf"):
+                    continue # Pattern database proves the goal is unreachable from here
                 new_f = new_g + new_h
                 
-                new_path = path + [skill]
-                
-                heapq.heappush(open_set, (new_f, new_g, new_skills_tuple, new_path))
-                visited.add(new_skills_tuple)
+                heapq.heappush(open_set, (new_f, new_g, new_state, path + [skill_id]))
+                visited.add(new_state)
+
+        return None, 0, search_trace
+
+    def plan_career_path_anytime_ids(self, start_ids, goal_ids, epsilon=3.0, epsilon_step=0.5,
+                                     time_budget=None, node_budget=None):
+        """
+        Anytime A* (weighted A*, f = g + epsilon * h, refined iteratively).
+        Starts greedy (large epsilon) to get a plan fast, then lowers epsilon
+        and searches again, pruning anything that cannot beat the incumbent.
+        Stops when the plan is proven optimal or the time / node budget runs out.
+        Returns: Path (skill id array), Total Cost, Reasoning Log, and the
+        suboptimality bound (cost <= bound * optimal cost; 1.0 means proven optimal).
+        """
+        start = self.registry.to_mask(start_ids)
+        goal = self.registry.to_mask(goal_ids)
+        table = self.pattern_db.table_for(goal_ids) if self.pattern_db else None
+        if table is not None and self.pattern_db.is_exact_for(table, start):
+            path, cost, trace = self.plan_by_lookup(start, goal, table)
+            return path, cost, trace, 1.0 if path is not None else float("inf")
+
+        budget = {
+            "deadline": time.monotonic() + time_budget if time_budget is not None else None,
+            "nodes_left": node_budget,
+        }
+        best_path, best_cost, best_trace = None, float("inf"), []
+        bound = float("inf")
+        eps = max(1.0, epsilon)
+
+        while True:
+            finished, path, cost, trace, lower_bound = self._weighted_search(
+                start, goal, eps, table, self.actions, best_cost, budget)
+
+            if path is not None:
+                best_path, best_cost, best_trace = path, cost, trace
+            if best_path is None:
+                # Either out of budget before any plan, or the goal is unreachable
+                return None, 0, trace, float("inf")
+
+            if best_cost == 0 or (finished and path is None):
+                # Nothing is cheaper than a zero-cost plan, and an exhausted open
+                # list means no plan beats the incumbent: both are proven optimal
+                bound = 1.0
+            else:
+                # AWA* bound: no plan can cost less than the cheapest g + h still open
+                if lower_bound > 0:
+                    bound = min(bound, best_cost / lower_bound)
+                if finished:
+                    bound = min(bound, eps)
+            if not finished or bound <= 1.0 or path is None:
+                # Budget exhausted, proven optimal, or open list exhausted
+                break
+            eps = max(1.0, eps - epsilon_step)
+
+        return array(ID_TYPECODE, best_path), best_cost, best_trace, max(1.0, bound)
+
+    def _weighted_search(self, start, goal, eps, table, actions, incumbent, budget):
+        """
+        One weighted A* pass for the anytime planner.
+        Nodes with g + h >= incumbent are pruned (they cannot improve the plan),
+        and closed states are reopened when reached more cheaply.
+        Returns: (finished, path, cost, trace, lower bound on the optimal cost)
+        """
+        start_h = self._h(start, goal, table)
+
+        # Priority Queue stores: (weighted f, g, h, state_mask, path)
+        open_set = [(eps * start_h, 0, start_h, start, [])]
+        best_g = {start: 0}
+        search_trace = []
+
+        while open_set:
+            if budget["deadline"] is not None and time.monotonic() >= budget["deadline"]:
+                return False, None, 0, search_trace, self._open_lower_bound(open_set, best_g, incumbent)
+            if budget["nodes_left"] is not None:
+                if budget["nodes_left"] <= 0:
+                    return False, None, 0, search_trace, self._open_lower_bound(open_set, best_g, incumbent)
+                budget["nodes_left"] -= 1
+
+            f, g, h, state, path = heapq.heappop(open_set)
+            if g > best_g.get(state, float("inf")) or g + h >= incumbent:
+                continue # Stale entry, or can no longer beat the incumbent
+            known = self.registry.from_mask(state)
+
+            search_trace.append({
+                "step_type": "Expanded Node",
+                "skill_ids": known,
+                "g_score": g,
+                "h_score": h,
+                "f_score": g + h,
+                "message": f"Explored state with {len(known)} skills (epsilon={eps}). Cost so far: {g}"
+            })
+
+            if goal & ~state == 0:
+                lower_bound = self._open_lower_bound(open_set, best_g, g)
+                return True, path, g, search_trace, lower_bound
+
+            for skill_id, bit, step_cost, prereqs in actions:
+                if state & bit or prereqs & state != prereqs:
+                    continue
+                new_state = state | bit
+                new_g = g + step_cost
+                if new_g >= best_g.get(new_state, float("inf")):
+                    continue
+                new_h = self._h(new_state, goal, table)
+                if new_g + new_h >= incumbent:
+                    continue
+                best_g[new_state] = new_g
+                heapq.heappush(open_set, (new_g + eps * new_h, new_g, new_h, new_state, path + [skill_id]))
+
+        # Open list exhausted: nothing cheaper than the incumbent exists
+        return True, None, 0, search_trace, incumbent
+
+    @staticmethod
+    def _open_lower_bound(open_set, best_g, incumbent):
+        lower_bound = incumbent
+        for f, g, h, state, path in open_set:
+            if g <= best_g.get(state, float("inf")):
+                lower_bound = min(lower_bound, g + h)
+        return lower_bound
+
+    def plan_by_lookup(self, start, goal, table):
+        """
+        Direct answer from an exact pattern database table.
+        From each state, pick the skill whose cost + remaining h equals the
+        current h (i.e. it lies on an optimal path), until the goal is reached.
+        """
+        state = start
+        path = array(ID_TYPECODE)
+        g = 0
+        search_trace = []
+
+        h = self.pattern_db.lookup(table, state)
+        if h == float("inf"):
+            return None, 0, search_trace
+
+        while True:
+            known = self.registry.from_mask(state)
+            search_trace.append({
+                "step_type": "Pattern Lookup",
+                "skill_ids": known,
+                "g_score": g,
+                "h_score": h,
+                "f_score": g + h,
+                "message": f"Looked up state with {len(known)} skills. Cost so far: {g}"
+            })
+            if h == 0:
+                return path, g, search_trace
+
+            for skill_id in table["skill_ids"]:
+                bit = 1 << skill_id
+                if state & bit or skill_id not in self.pattern_db.costs:
+                    continue
+                prereqs = self.kb.get_prerequisite_mask(skill_id)
+                if prereqs & state != prereqs:
+                    continue
+                step_cost = self.pattern_db.costs[skill_id]
+                next_h = self.pattern_db.lookup(table, state | bit)
+                if step_cost + next_h == h:
+                    break
+            else:
+                # Only possible if the table does not match the current ontology / costs
+                raise RuntimeError("Pattern database table is inconsistent: no successor lies on an "
+                                   f"optimal path from a state with h = {h}")
 
-        return None, 0, search_trace
\ No newline at end of file
+            state |= bit
+            path.append(skill_id)
+            g += step_cost
+            h = next_h
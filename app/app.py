@@ -1,21 +1,26 @@
 # app.py
 import streamlit as st
 import os
-import pandas as pd
-import networkx as nx
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-import plotly.express as px
+# pandas / networkx / matplotlib / plotly are imported inside the functions
+# that draw with them, so they only load when a chart is actually rendered
 
 # Import our AI Modules
 from resume_parser import ResumeParser
 from knowledge_base import SkillOntology
+from role_catalog import RoleCatalog
 from search_agent import CareerPathPlanner
 from inference_engine import FuzzyEvaluator
 from state_manager import CareerState
+from candidate_store import CandidateStore, content_hash
 # NEW IMPORT FOR GENETIC ALGO
 from genetic_scheduler import GeneticScheduler
 
+# Wall-clock budget (seconds) for the anytime A* planner in the UI
+PLANNER_TIME_BUDGET = 1.0
+
+# Append-only log behind the recruiter candidate pool (replayed on startup)
+CANDIDATE_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "candidates.jsonl")
+
 # Page Config
 st.set_page_config(page_title="AI Career Agent", layout="wide", page_icon="🤖")
 
@@ -34,11 +39,29 @@ def save_uploaded_file(uploaded_file):
         f.write(uploaded_file.getbuffer())
     return os.path.join("temp", uploaded_file.name)
 
+@st.cache_resource
+def load_role_catalog():
+    """Role catalog is compiled once per server process, not on every rerun."""
+    return RoleCatalog()
+
+@st.cache_resource
+def load_planner():
+    """Planner (ontology + pattern database tables) is built once per server process, not on every rerun."""
+    return CareerPathPlanner()
+
+@st.cache_resource
+def load_candidate_store():
+    """One persistent candidate pool shared by every session of the server process."""
+    return CandidateStore(CANDIDATE_STORE_PATH)
+
 def draw_better_ontology(kb):
     """
     Creates a Tree-Structured visualization of the Knowledge Base.
     Uses 'Multipartite Layout' to arrange nodes in clear vertical layers (Hierarchy).
     """
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
     layers = {}
     try:
         lengths = nx.single_source_shortest_path_length(kb.graph, "CS_Student")
@@ -84,6 +107,8 @@ def draw_better_ontology(kb):
 
 def plot_gauge_chart(score):
     """Creates a Speedometer (Gauge) chart for the Fuzzy Score."""
+    import plotly.graph_objects as go
+
     fig = go.Figure(go.Indicator(
         mode = "gauge+number",
         value = score,
@@ -103,6 +128,9 @@ def plot_gauge_chart(score):
 
 def plot_skill_gap(current, required):
     """Creates a Bar Chart comparing 'What I Have' vs 'What I Need'."""
+    import pandas as pd
+    import plotly.express as px
+
     data = []
     for skill in required:
         status = "Have" if skill in current else "Missing"
@@ -123,15 +151,13 @@ def main():
     
     # --- SIDEBAR CONFIGURATION ---
     st.sidebar.header("1. Goal Definition")
-    target_role = st.sidebar.selectbox("Select Target Role", 
-                                       ["Python Developer", "Data Scientist", "Frontend Engineer"])
+    catalog = load_role_catalog()
+    target_role = st.sidebar.selectbox("Select Target Role", catalog.role_names)
     
-    goals = {
-        "Python Developer": ["Python", "Django", "SQL", "Git"],
-        "Data Scientist": ["Python", "Machine Learning", "Pandas", "SQL"],
-        "Frontend Engineer": ["HTML", "JavaScript", "React", "CSS"]
-    }
-    required_skills = goals[target_role]
+    # Stages exchange skill ids; names are only decoded for display
+    registry = catalog.registry
+    required_ids = catalog.required_skill_ids(target_role)
+    required_skills = registry.decode(required_ids)
     st.sidebar.info(f"**Goal State Vector:**\n {required_skills}")
 
     # GUIDELINE: Ethical Considerations (Bonus)
@@ -165,9 +191,12 @@ def main():
 
     if uploaded_file is not None:
         
+        # Same bytes -> same id, so re-uploads are recognised (and stay anonymous)
+        resume_hash = content_hash(uploaded_file.getvalue())
+
         # Ethical Logic: Hide Filename if Blind Mode is ON
         if blind_mode:
-            display_name = "Candidate_ID_XA12.pdf (Anonymized)"
+            display_name = f"Candidate_ID_{resume_hash[:8].upper()} (Anonymized)"
         else:
             display_name = uploaded_file.name
         st.write(f"Processing File: **{display_name}**")
@@ -177,7 +206,8 @@ def main():
         parser = ResumeParser()
         
         extracted_text = parser.extract_text_from_pdf(file_path)
-        detected_skills = parser.extract_skills(extracted_text)
+        detected_ids = parser.extract_skill_ids(extracted_text)
+        detected_skills = registry.decode(detected_ids)
         exp_years = parser.get_experience_level(extracted_text)
         
         st.divider()
@@ -189,6 +219,13 @@ def main():
         with col2:
             st.metric("Detected Experience", f"{exp_years} Years")
 
+        # Best-fit roles from the catalog (inverted index: only roles sharing a skill are scored)
+        best_fit = catalog.best_fit_roles(detected_ids, top_k=5)
+        if best_fit:
+            import pandas as pd
+            st.write("**Best-Fit Roles (Weighted Skill Match):**")
+            st.dataframe(pd.DataFrame(best_fit, columns=["Role", "Match %"]), hide_index=True)
+
         # --- STAGE 2: VISUALIZATION & KR ---
         st.divider()
         st.subheader("3. State Space Analysis (Visualization)")
@@ -206,8 +243,7 @@ def main():
         st.divider()
         st.subheader("4. Decision Making (Fuzzy Logic Engine)")
         
-        match_count = len([s for s in required_skills if s in detected_skills])
-        match_percent = (match_count / len(required_skills)) * 100
+        match_percent = catalog.match_percent(target_role, detected_ids)
         evaluator = FuzzyEvaluator()
         score = evaluator.evaluate_candidate(match_percent, exp_years)
         
@@ -222,12 +258,20 @@ def main():
             - Fuzzy Rule Fired: *If match is {match_percent}% and exp is {exp_years}, then suitability is...*
             """)
 
+        # Every evaluated resume joins the candidate pool once per target role
+        # (the store ignores content it already holds, across reruns and sessions)
+        load_candidate_store().add_candidate_ids(detected_ids, exp_years, name=display_name, score=score,
+                                                 role=target_role, resume_hash=resume_hash)
+
         # --- STAGE 4: PLANNING (A* SEARCH) ---
         st.divider()
         st.subheader("5. Agent Planning (A* Search & Explainability)")
         
-        planner = CareerPathPlanner()
-        path, cost, trace = planner.plan_career_path(detected_skills, required_skills)
+        planner = load_planner()
+        # Anytime mode: bounded latency for the interactive UI
+        path_ids, cost, trace, bound = planner.plan_career_path_anytime_ids(
+            detected_ids, required_ids, time_budget=PLANNER_TIME_BUDGET)
+        path = None if path_ids is None else registry.decode(path_ids)
         
         if path:
             # GUIDELINE: CSP (Constraint Satisfaction)
@@ -243,15 +287,18 @@ def main():
             col1, col2 = st.columns([2, 1])
             with col1:
                 st.markdown(f"**Goal:** Transition from *Current State* to *{target_role}*")
-                st.markdown(f"**Optimal Path Cost:** {cost} Weeks")
+                if bound <= 1.0:
+                    st.markdown(f"**Optimal Path Cost:** {cost} Weeks")
+                else:
+                    st.markdown(f"**Path Cost:** {cost} Weeks (within {round(bound, 2)}x of optimal)")
                 
                 # Timeline view
-                for i, step in enumerate(path):
+                for i, (skill_id, step) in enumerate(zip(path_ids, path)):
                     cols = st.columns([0.1, 0.9])
                     with cols[0]:
                         st.markdown(f"## {i+1}⬇")
                     with cols[1]:
-                        st.success(f"**Action:** Learn {step} (Est. Time: {planner.learning_costs.get(step, 2)} weeks)")
+                        st.success(f"**Action:** Learn {step} (Est. Time: {planner.learning_costs.get(skill_id, 2)} weeks)")
             
             with col2:
                 # GUIDELINE: Explainable AI
@@ -262,7 +309,7 @@ def main():
                     for log in trace:
                         st.markdown(f"""
                         ---
-                        **State Evaluated:** {len(log['skills'])} Skills Known
+                        **State Evaluated:** {len(log['skill_ids'])} Skills Known
                         - **G (Cost so far):** {log['g_score']}
                         - **H (Heuristic):** {log['h_score']}
                         - **F (Total):** {log['f_score']}
@@ -277,7 +324,7 @@ def main():
             st.info("🧬 **Genetic Algorithm Logic:** The AI creates a 'Population' of random schedules, 'Mutates' them, and performs 'Crossover' to find the most balanced timetable.")
             
             # Use the path found by A* for scheduling
-            skills_to_schedule = path 
+            skills_to_schedule = path_ids 
             
             col1, col2 = st.columns([1, 3])
             with col1:
@@ -303,10 +350,41 @@ def main():
                     - ✅ Balanced Load.
                 """)
 
+        elif path is None:
+            st.warning("⏱️ No plan found within the planning budget (or the goal is unreachable from this state).")
+
         else:
             st.balloons()
             st.success("✅ Goal State Reached! No further actions required.")
 
+    # --- CANDIDATE POOL (RECRUITER SEARCH) ---
+    st.divider()
+    with st.expander("🗂️ Candidate Pool (Recruiter Search)"):
+        store = load_candidate_store()
+        st.caption(f"Ranking candidates scored for **{target_role}** ({store.count(role=target_role)} indexed). "
+                   "Query example: Python AND SQL AND NOT junior (quote names containing and/or/not)")
+        q1, q2, q3 = st.columns([3, 1, 1])
+        with q1:
+            query = st.text_input("Boolean Skill Query", value="")
+        with q2:
+            min_experience = st.number_input("Min Experience (Years)", min_value=0, value=0)
+        with q3:
+            top_k = st.number_input("Top K", min_value=1, value=10)
+        try:
+            results = store.search(query, min_experience=min_experience or None, top_k=int(top_k),
+                                   role=target_role)
+        except ValueError as e:
+            st.error(f"Invalid query: {e}")
+        else:
+            if results:
+                import pandas as pd
+                rows = [{"Candidate": record["name"], "Suitability": round(record["score"], 2),
+                         "Experience": record["experience"], "Skills": ", ".join(registry.decode(record["skill_ids"]))}
+                        for _, record in results]
+                st.dataframe(pd.DataFrame(rows), hide_index=True)
+            else:
+                st.write("No matching candidates.")
+
     # --- FINAL SECTION: LEARNINGS (MANDATORY) ---
     st.divider()
     with st.expander("📚 Project Learnings & Future Scope (Mandatory)"):
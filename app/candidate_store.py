@@ -0,0 +1,342 @@
+# candidate_store.py
+import bisect
+import hashlib
+import heapq
+import json
+import os
+import re
+import threading
+
+from skill_registry import get_registry
+from state_manager import CareerState
+
+# Experience bands used by NOT junior / senior style terms in queries.
+# Kept crisp (integer years) so they can be answered from the experience index.
+LEVEL_BANDS = {
+    "junior": (0, 2),
+    "mid": (3, 5),
+    "senior": (6, None),
+}
+
+# Operators are matched case-insensitively ("python and sql" == "Python AND SQL").
+# A double-quoted term is always a skill name, so names that contain and / or / not
+# can still be queried: "Research and Development" AND Python
+QUERY_TOKENS = re.compile(r'("[^"]*"|\(|\)|\bAND\b|\bOR\b|\bNOT\b)', re.IGNORECASE)
+OPERATORS = ("AND", "OR", "NOT")
+
+
+def content_hash(data):
+    """Stable id of a resume's content (bytes or text); identical uploads share it."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class CandidateStore:
+    """
+    Persistent candidate pool built on top of CareerState.
+    Every candidate gets an integer doc id. For each skill (registry id) we
+    keep a posting list as a bitmap (a Python int, bit i = candidate i), so AND / OR / NOT
+    become single &, |, ~ operations over the whole pool.
+    Experience is indexed as a sorted list of distinct years, each with its
+    own bitmap, so "experience >= 3" is a bisect plus a few ORs.
+    Skill names are only resolved when a query is parsed.
+    Suitability scores depend on the target role, so each record stores the
+    role it was scored for (with a posting list per role), and the same
+    resume content is only indexed once per role.
+    Safe to share between threads.
+    """
+    def __init__(self, path=None, registry=None):
+        self.path = path
+        self.registry = registry or get_registry()
+        # Query terms are case-insensitive: lowercase name -> skill id
+        self.skill_lookup = {name.lower(): skill_id for skill_id, name in enumerate(self.registry.names)}
+        self.candidates = []      # doc id -> record dict
+        self.skill_index = {}     # skill id -> bitmap
+        self.exp_years = []       # sorted distinct experience values
+        self.exp_index = {}       # experience -> bitmap
+        self.role_index = {}      # target role -> bitmap
+        self.doc_by_key = {}      # (content hash, role) -> doc id
+        # Registry the log's skill ids currently refer to (see _write_log_header)
+        self.log_fingerprint = None
+        # Doc ids added since the last query, per posting list. Folding them
+        # in one batch keeps add_candidate O(skills) instead of O(pool size).
+        self.pending_skills = {}
+        self.pending_exp = {}
+        self.pending_roles = {}
+        self.by_score = []        # doc ids, best suitability first
+        self._score_sorted = True
+        # One store is shared by every Streamlit session thread: adds (doc ids,
+        # pending lists, log appends) and queries (which fold pending ids) are serialised
+        self._lock = threading.RLock()
+
+        if self.path and os.path.exists(self.path):
+            self._replay_log()
+
+    # --- Indexing ---
+    def add_candidate_ids(self, skill_ids, experience, budget_hours=0, name=None, score=0.0,
+                          role=None, resume_hash=None):
+        """
+        Indexes one candidate (registry skill ids) incrementally (no rebuild of the pool).
+        `score` is the suitability for `role`. If the same resume (resume_hash) was
+        already indexed for that role, its existing doc id is returned instead.
+        The record is also appended to the on-disk log so it survives restarts.
+        """
+        with self._lock:
+            if resume_hash is not None and (resume_hash, role) in self.doc_by_key:
+                return self.doc_by_key[(resume_hash, role)]
+            record = {
+                "name": name,
+                "hash": resume_hash,
+                "role": role,
+                "skill_ids": sorted(set(int(skill_id) for skill_id in skill_ids)),
+                "experience": int(experience),
+                "budget": budget_hours,
+                "score": float(score),
+            }
+            doc_id = self._index_record(record)
+
+            if self.path:
+                with open(self.path, "a") as f:
+                    if self.log_fingerprint != self.registry.fingerprint:
+                        self._write_log_header(f)
+                    f.write(json.dumps(record) + "\n")
+            return doc_id
+
+    def _write_log_header(self, f):
+        """
+        Records store bare skill ids, so the log says which registry they refer
+        to. A header line is written before the first record under a new registry.
+        """
+        f.write(json.dumps({"registry": self.registry.fingerprint, "skill_names": self.registry.names}) + "\n")
+        self.log_fingerprint = self.registry.fingerprint
+
+    def add_candidate(self, state, name=None, score=0.0, role=None, resume_hash=None):
+        """Same as add_candidate_ids, for a CareerState (skill names)."""
+        return self.add_candidate_ids(self.registry.encode(state.skills), state.experience,
+                                      state.study_budget, name=name, score=score,
+                                      role=role, resume_hash=resume_hash)
+
+    def add_parsed_resume(self, parser, text, name=None, score=0.0, budget_hours=0, role=None):
+        """Convenience wrapper: ResumeParser output (skill ids) -> index, deduplicated by text."""
+        return self.add_candidate_ids(parser.extract_skill_ids(text), parser.get_experience_level(text),
+                                      budget_hours, name=name, score=score,
+                                      role=role, resume_hash=content_hash(text))
+
+    def _index_record(self, record):
+        doc_id = len(self.candidates)
+        self.candidates.append(record)
+        self.by_score.append(doc_id)
+        self._score_sorted = False
+        record.setdefault("role", None)
+        record.setdefault("hash", None)
+        if record["hash"] is not None:
+            self.doc_by_key[(record["hash"], record["role"])] = doc_id
+        self.pending_roles.setdefault(record["role"], []).append(doc_id)
+
+        for skill_id in record["skill_ids"]:
+            self.pending_skills.setdefault(skill_id, []).append(doc_id)
+
+        exp = record["experience"]
+        if exp not in self.exp_index:
+            bisect.insort(self.exp_years, exp)
+            self.exp_index[exp] = 0
+        self.pending_exp.setdefault(exp, []).append(doc_id)
+        return doc_id
+
+    def _posting(self, index, pending, key):
+        """Returns the bitmap for key, folding in any pending doc ids first."""
+        new_ids = pending.pop(key, None)
+        if new_ids:
+            delta = bytearray(new_ids[-1] // 8 + 1)
+            for doc_id in new_ids:
+                delta[doc_id >> 3] |= 1 << (doc_id & 7)
+            index[key] = index.get(key, 0) | int.from_bytes(delta, "little")
+        return index.get(key, 0)
+
+    @property
+    def all_docs(self):
+        # Doc ids are dense (0..n-1), so the universe bitmap is just n ones
+        return (1 << len(self.candidates)) - 1
+
+    def _replay_log(self):
+        remap = None              # log skill id -> current skill id (None = same registry)
+        with open(self.path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if "registry" in record:
+                    remap = self._remap_from_header(record)
+                    continue
+                if "skill_ids" not in record:
+                    # Logs written before the skill registry stored names
+                    record["skill_ids"] = sorted(set(self.registry.encode(record.pop("skills"))))
+                elif remap is not None:
+                    record["skill_ids"] = sorted(remap[skill_id] for skill_id in record["skill_ids"])
+                self._index_record(record)
+
+    def _remap_from_header(self, header):
+        """Maps the ids of a header's registry onto the current one, by skill name."""
+        self.log_fingerprint = header["registry"]
+        if header["registry"] == self.registry.fingerprint:
+            return None
+        missing = [name for name in header["skill_names"] if name not in self.registry]
+        if missing:
+            raise ValueError(f"Candidate log {self.path} uses skills missing from the skill registry: {missing}")
+        return [self.registry.id(name) for name in header["skill_names"]]
+
+    def __len__(self):
+        return len(self.candidates)
+
+    # --- Experience Index ---
+    def experience_between(self, low=None, high=None):
+        """Bitmap of candidates with low <= experience <= high (None = open end)."""
+        with self._lock:
+            start = 0 if low is None else bisect.bisect_left(self.exp_years, low)
+            end = len(self.exp_years) if high is None else bisect.bisect_right(self.exp_years, high)
+
+            result = 0
+            for exp in self.exp_years[start:end]:
+                result |= self._posting(self.exp_index, self.pending_exp, exp)
+            return result
+
+    # --- Boolean Queries ---
+    def match(self, query):
+        """
+        Evaluates a boolean skill query to a bitmap.
+        Grammar: expr := term (OR term)* ; term := factor (AND factor)* ;
+                 factor := NOT factor | '(' expr ')' | skill | "quoted skill" | junior/mid/senior
+        Example: "Python AND SQL AND NOT junior"
+        """
+        with self._lock:
+            tokens = []
+            for token in QUERY_TOKENS.split(query):
+                token = token.strip()
+                if token:
+                    tokens.append(token.upper() if token.upper() in OPERATORS else token)
+            result, pos = self._parse_or(tokens, 0)
+            if pos != len(tokens):
+                raise ValueError(f"Unexpected token in query: {tokens[pos]!r}")
+            return result
+
+    def _parse_or(self, tokens, pos):
+        result, pos = self._parse_and(tokens, pos)
+        while pos < len(tokens) and tokens[pos] == "OR":
+            rhs, pos = self._parse_and(tokens, pos + 1)
+            result |= rhs
+        return result, pos
+
+    def _parse_and(self, tokens, pos):
+        result, pos = self._parse_not(tokens, pos)
+        while pos < len(tokens) and tokens[pos] == "AND":
+            rhs, pos = self._parse_not(tokens, pos + 1)
+            result &= rhs
+        return result, pos
+
+    def _parse_not(self, tokens, pos):
+        if pos >= len(tokens):
+            raise ValueError("Query ended unexpectedly")
+        token = tokens[pos]
+        if token == "NOT":
+            operand, pos = self._parse_not(tokens, pos + 1)
+            return self.all_docs & ~operand, pos
+        if token == "(":
+            result, pos = self._parse_or(tokens, pos + 1)
+            if pos >= len(tokens) or tokens[pos] != ")":
+                raise ValueError("Missing closing parenthesis in query")
+            return result, pos + 1
+        if token in ("AND", "OR", ")"):
+            raise ValueError(f"Unexpected token in query: {token!r}")
+        return self._term_bitmap(token), pos + 1
+
+    def _term_bitmap(self, term):
+        if len(term) >= 2 and term[0] == term[-1] == '"':
+            term = term[1:-1].strip()
+        key = term.lower()
+        if key in LEVEL_BANDS:
+            return self.experience_between(*LEVEL_BANDS[key])
+        if key not in self.skill_lookup:
+            raise ValueError(f"Unknown skill in query: {term!r}")
+        return self._posting(self.skill_index, self.pending_skills, self.skill_lookup[key])
+
+    # --- Ranking ---
+    def search(self, query=None, min_experience=None, top_k=50, role=None):
+        """
+        Full recruiter query: boolean skill filter + experience floor,
+        ranked by the stored fuzzy suitability score.
+        Pass `role` to rank only scores computed for that target role
+        (scores for different roles are not comparable).
+        Returns: list of (doc_id, record) best first.
+        """
+        if top_k <= 0:
+            return []
+        with self._lock:
+            hits = self._filter(query, min_experience, role)
+            hit_count = hits.bit_count()
+
+            # Sparse result: score only the hits.
+            # Dense result: walk the global score order and stop after top_k hits.
+            if hit_count <= top_k * 32:
+                best = heapq.nlargest(top_k, self._iter_docs(hits),
+                                      key=lambda doc_id: self.candidates[doc_id]["score"])
+            else:
+                self._sort_by_score()
+                data = hits.to_bytes(len(self.candidates) // 8 + 1, "little")
+                best = []
+                for doc_id in self.by_score:
+                    if data[doc_id >> 3] & (1 << (doc_id & 7)):
+                        best.append(doc_id)
+                        if len(best) == top_k:
+                            break
+            return [(doc_id, self.candidates[doc_id]) for doc_id in best]
+
+    def count(self, query=None, min_experience=None, role=None):
+        with self._lock:
+            return self._filter(query, min_experience, role).bit_count()
+
+    def _filter(self, query, min_experience, role=None):
+        # No query (or only whitespace) means every candidate
+        query = (query or "").strip()
+        hits = self.match(query) if query else self.all_docs
+        if min_experience is not None:
+            hits &= self.experience_between(min_experience, None)
+        if role is not None:
+            hits &= self._posting(self.role_index, self.pending_roles, role)
+        return hits
+
+    def _sort_by_score(self):
+        # New candidates are appended unsorted; re-sort lazily before ranking
+        if not self._score_sorted:
+            self.by_score.sort(key=lambda doc_id: -self.candidates[doc_id]["score"])
+            self._score_sorted = True
+
+    @staticmethod
+    def _iter_docs(bitmap):
+        """Yields the doc ids set in a bitmap, scanning it a byte at a time."""
+        data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+        for byte_idx, byte in enumerate(data):
+            if not byte:
+                continue
+            base = byte_idx * 8
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield base + bit
+
+    def to_state(self, doc_id):
+        """Rebuilds the CareerState of a stored candidate."""
+        record = self.candidates[doc_id]
+        return CareerState(self.registry.decode(record["skill_ids"]), record["experience"], record["budget"])
+
+
+# Test run
+if __name__ == "__main__":
+    store = CandidateStore()
+    store.add_candidate(CareerState(["Python", "SQL", "Django"], 4, 10), name="A", score=7.5, role="Python Developer")
+    store.add_candidate(CareerState(["Python", "SQL"], 1, 10), name="B", score=6.0, role="Python Developer")
+    store.add_candidate(CareerState(["JavaScript", "React"], 5, 10), name="C", score=8.1, role="Frontend Engineer")
+
+    for doc_id, record in store.search("Python AND SQL AND NOT junior", min_experience=3, top_k=50,
+                                       role="Python Developer"):
+        print(doc_id, record["name"], record["score"])
@@ -1,5 +1,4 @@
 # state_manager.py
-import numpy as np
 
 class CareerState:
     """
@@ -17,6 +16,8 @@ class CareerState:
         Converts internal state to a mathematical vector for AI processing.
         Example: [1, 0, 1, 0...] for [Python, Java, SQL, C++]
         """
+        import numpy as np
+
         vector = []
         for skill in all_possible_skills:
             if skill in self.skills:
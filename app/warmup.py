@@ -0,0 +1,126 @@
+# warmup.py
+"""
+Cold-start helpers.
+- warm_up(): preload heavy dependencies (and the spaCy model) in a worker
+  process before it takes traffic, since every module now imports them lazily.
+- import_profile(): measure what importing a module costs in a fresh
+  interpreter (python -X importtime), to track cold-start time over time.
+
+    python warmup.py warm
+    python warmup.py profile search_agent --top 10 --json profile.json
+"""
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE_DIRS = [os.path.join(ROOT, d) for d in ("Ccore", "agents", "app")]
+
+# Heavy third-party modules used by each component
+WARMUP_MODULES = {
+    "parser": ["pdfplumber", "spacy"],
+    "ontology": ["networkx"],
+    "fuzzy": ["numpy", "skfuzzy", "skfuzzy.control"],
+    "scheduler": ["pandas"],
+    "ui": ["matplotlib.pyplot", "plotly.graph_objects", "plotly.express"],
+}
+
+# What a pipeline worker needs (no plotting libraries)
+WORKER_COMPONENTS = ("parser", "ontology", "fuzzy", "scheduler")
+
+
+def warm_up(components=WORKER_COMPONENTS, load_models=True):
+    """
+    Imports the heavy modules of the given components and loads the NLP model.
+    Returns: seconds spent per step, e.g. {"parser": 1.2, "spacy_model": 0.8}.
+    """
+    timings = {}
+    for component in components:
+        start = time.perf_counter()
+        for module in WARMUP_MODULES[component]:
+            importlib.import_module(module)
+        timings[component] = round(time.perf_counter() - start, 4)
+
+    if load_models and "parser" in components:
+        from resume_parser import get_nlp
+
+        start = time.perf_counter()
+        get_nlp()
+        timings["spacy_model"] = round(time.perf_counter() - start, 4)
+    return timings
+
+
+def import_profile(module, top=15):
+    """
+    Imports `module` in a fresh interpreter with -X importtime.
+    Returns the wall-clock import time and the slowest imports by self time.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(MODULE_DIRS + [env.get("PYTHONPATH", "")]).rstrip(os.pathsep)
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    # Lines look like: "import time:  self [us] | cumulative | imported package"
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append({
+            "module": name.strip(),
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+
+    rows.sort(key=lambda row: row["self_ms"], reverse=True)
+    return {
+        "module": module,
+        "wall_ms": round(float(result.stdout.strip().splitlines()[-1]) * 1000, 2),
+        "modules_imported": len(rows),
+        "slowest": rows[:top],
+    }
+
+
+def print_profile(report):
+    print(f"import {report['module']}: {report['wall_ms']} ms, {report['modules_imported']} modules")
+    print(f"{'self ms':>10}{'cumulative ms':>15}  module")
+    for row in report["slowest"]:
+        print(f"{row['self_ms']:>10.1f}{row['cumulative_ms']:>15.1f}  {row['module']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm-up and import-time profiling for the career agent.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    warm = sub.add_parser("warm", help="Preload heavy dependencies and report how long it took")
+    warm.add_argument("--components", nargs="+", default=list(WORKER_COMPONENTS), choices=list(WARMUP_MODULES))
+
+    profile = sub.add_parser("profile", help="Import-time profile of a module in a fresh interpreter")
+    profile.add_argument("module", nargs="?", default="app")
+    profile.add_argument("--top", type=int, default=15)
+    profile.add_argument("--json", help="Save the report as JSON")
+
+    args = parser.parse_args()
+    if args.command == "warm":
+        for step, seconds in warm_up(args.components).items():
+            print(f"{step:<12}{seconds * 1000:>10.1f} ms")
+    else:
+        report = import_profile(args.module, args.top)
+        print_profile(report)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    for path in MODULE_DIRS:
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    main()
@@ -0,0 +1,466 @@
+# load_test.py
+"""
+End-to-end load test for the agent pipeline:
+PDF -> ResumeParser -> scoring (RoleCatalog + FuzzyEvaluator)
+    -> CareerPathPlanner (anytime A*) -> GeneticScheduler
+
+Runs fully offline:
+    python load_test.py generate --out corpus --count 100 --pages 1-3 --density 0.3 --plannable 0.5
+    python load_test.py run --corpus corpus --concurrency 4 --rate 20 --out run_a.json
+    python load_test.py compare run_a.json run_b.json
+"""
+import argparse
+import glob
+import json
+import math
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE_DIRS = [os.path.join(ROOT, d) for d in ("Ccore", "agents", "app")]
+
+FILLER = [
+    "Collaborated with cross-functional teams to deliver features on schedule.",
+    "Improved reliability of internal services and reduced support tickets.",
+    "Mentored interns and documented onboarding guides for new members.",
+    "Participated in code reviews and sprint planning sessions.",
+    "Presented project results to stakeholders at quarterly reviews.",
+    "Designed test plans and automated regression checks.",
+]
+
+STAGES = ["parse", "score", "plan", "schedule"]
+
+LINES_PER_PAGE = 45
+
+
+def add_module_paths():
+    for path in MODULE_DIRS:
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+# --- Synthetic Corpus ---
+def _pdf_escape(line):
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path, pages):
+    """
+    Minimal PDF writer (one Helvetica text stream per page).
+    Avoids any PDF library so the corpus can be generated anywhere.
+    """
+    objects = []
+    page_count = len(pages)
+    # 1: catalog, 2: page tree, 3: font, then (page, content) pairs
+    kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(page_count))
+    objects.append("<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    for i, lines in enumerate(pages):
+        content_id = 5 + 2 * i
+        text = "BT /F1 10 Tf 14 TL 50 800 Td " + " ".join(f"({_pdf_escape(l)}) Tj T*" for l in lines) + " ET"
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>")
+        objects.append(f"<< /Length {len(text.encode('latin-1'))} >>\nstream\n{text}\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+def skill_pool():
+    """Skill names the parser knows (from the skill registry; needs no NLP stack)."""
+    add_module_paths()
+    from skill_registry import get_registry
+
+    registry = get_registry()
+    return registry.decode(registry.skill_ids())
+
+
+def plannable_skills(role):
+    """
+    Splits what `role` needs into
+    - entry skills: a candidate can only have them from the resume, because they
+      are not learnable or one of their prerequisites is an ontology category
+      (e.g. Backend) that no parsed resume contains. Without them the planner
+      finds no path, so the plan stage would measure nothing;
+    - goal skills the plan has to add on top of them.
+    Returns: (entry skill names, skill names left to plan)
+    """
+    add_module_paths()
+    from role_catalog import RoleCatalog
+    from search_agent import CareerPathPlanner
+
+    catalog = RoleCatalog()
+    planner = CareerPathPlanner(use_pattern_db=False)
+    registry = catalog.registry
+    learnable = set(planner.learning_costs)
+    skills = registry.to_mask(registry.skill_ids())
+
+    required = catalog.required_skill_ids(role)
+    entry, seen = [], set()
+    frontier = list(required)
+    while frontier:
+        skill_id = frontier.pop()
+        if skill_id in seen:
+            continue
+        seen.add(skill_id)
+        prereqs = planner.kb.get_prerequisite_mask(skill_id)
+        if skill_id not in learnable or prereqs & ~skills:
+            entry.append(registry.name(skill_id))
+        else:
+            frontier.extend(registry.from_mask(prereqs))
+    to_plan = [registry.name(skill_id) for skill_id in required if registry.name(skill_id) not in entry]
+    return sorted(entry), sorted(to_plan)
+
+
+def synthetic_resume(rng, index, page_count, skill_density, skills_known, core_skills=None):
+    """
+    Builds the text lines of one resume.
+    skill_density: probability that a body line mentions 1-3 skills.
+    core_skills: listed up front when given (makes a plan reachable, see plannable_skills).
+    """
+    years = rng.randint(0, 12)
+    lines = [f"Candidate {index:05d}", f"Software engineer with {years} years of experience.", ""]
+    if core_skills:
+        lines.insert(2, f"Core skills: {', '.join(core_skills)}.")
+    while len(lines) < page_count * LINES_PER_PAGE:
+        if rng.random() < skill_density:
+            skills = rng.sample(skills_known, rng.randint(1, 3))
+            lines.append(f"Built and maintained projects using {', '.join(skills)}.")
+        else:
+            lines.append(rng.choice(FILLER))
+    return [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]
+
+
+def generate_corpus(out_dir, count, pages, skill_density, seed, role, plannable):
+    """
+    Writes a reproducible corpus: same arguments -> byte-identical PDFs.
+    plannable: share of resumes that list the entry skills of `role` and none of
+    the skills left to plan, so the planner has a reachable, non-trivial goal
+    for them (the rest usually has no reachable plan).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    low, high = pages
+    skills_known = skill_pool()
+    core_skills, to_plan = plannable_skills(role)
+    skills_without_goal = [skill for skill in skills_known if skill not in to_plan]
+    for index in range(count):
+        if rng.random() < plannable:
+            core, pool = core_skills, skills_without_goal
+        else:
+            core, pool = None, skills_known
+        page_lines = synthetic_resume(rng, index, rng.randint(low, high), skill_density, pool, core)
+        write_pdf(os.path.join(out_dir, f"resume_{index:05d}.pdf"), page_lines)
+
+    with open(os.path.join(out_dir, "corpus.json"), "w") as f:
+        json.dump({"count": count, "pages": list(pages), "skill_density": skill_density, "seed": seed,
+                   "role": role, "plannable": plannable, "core_skills": core_skills}, f)
+
+
+# --- Pipeline Worker ---
+_worker = threading.local()
+
+
+def _components(role):
+    """One set of AI modules per worker thread/process (like a long-lived service)."""
+    if getattr(_worker, "role", None) != role:
+        add_module_paths()
+        from resume_parser import ResumeParser
+        from role_catalog import RoleCatalog
+        from inference_engine import FuzzyEvaluator
+        from search_agent import CareerPathPlanner
+        from genetic_scheduler import GeneticScheduler
+
+        _worker.role = role
+        _worker.parser = ResumeParser()
+        _worker.catalog = RoleCatalog()
+        _worker.evaluator = FuzzyEvaluator()
+        _worker.planner = CareerPathPlanner()
+        _worker.scheduler_cls = GeneticScheduler
+    return _worker
+
+
+def init_worker(role):
+    """Pool initializer: loads every module (and the NLP model) before the worker takes work."""
+    add_module_paths()
+    from warmup import warm_up
+
+    warm_up()
+    _components(role)
+
+
+def _rendezvous(barrier):
+    barrier.wait()
+    return os.getpid()
+
+
+def start_all_workers(pool, mode, concurrency):
+    """
+    Pools start workers lazily, so a worker could still be starting (and warming
+    up) during the measured run. Each rendezvous task blocks until `concurrency`
+    of them run at once, which only happens when every worker is up.
+    """
+    if mode == "process":
+        with multiprocessing.Manager() as manager:
+            barrier = manager.Barrier(concurrency)
+            return list(pool.map(_rendezvous, [barrier] * concurrency))
+    barrier = threading.Barrier(concurrency)
+    return list(pool.map(_rendezvous, [barrier] * concurrency))
+
+
+def run_pipeline(pdf_path, role, plan_budget, ga_generations):
+    """
+    Runs one resume through every stage.
+    Returns: per-stage seconds, the plan outcome (found, bound, steps), and
+    (pid, peak RSS in MB) of the worker process that ran it.
+    """
+    w = _components(role)
+    timings = {}
+
+    t0 = time.perf_counter()
+    text = w.parser.extract_text_from_pdf(pdf_path)
+    skill_ids = w.parser.extract_skill_ids(text)
+    exp_years = w.parser.get_experience_level(text)
+    t1 = time.perf_counter()
+    timings["parse"] = t1 - t0
+
+    required_ids = w.catalog.required_skill_ids(role)
+    match_percent = w.catalog.match_percent(role, skill_ids)
+    w.evaluator.evaluate_candidate(match_percent, exp_years)
+    t2 = time.perf_counter()
+    timings["score"] = t2 - t1
+
+    path_ids, cost, trace, bound = w.planner.plan_career_path_anytime_ids(skill_ids, required_ids,
+                                                                          time_budget=plan_budget)
+    t3 = time.perf_counter()
+    timings["plan"] = t3 - t2
+
+    ga = w.scheduler_cls(path_ids or [])
+    ga.generations = ga_generations
+    ga.format_schedule(ga.run_evolution())
+    timings["schedule"] = time.perf_counter() - t3
+
+    plan = {"found": path_ids is not None, "bound": bound, "steps": len(path_ids or [])}
+    return timings, plan, (os.getpid(), max_rss_mb())
+
+
+# --- Load Driver ---
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(values):
+    values = sorted(values)
+    return {
+        "mean_ms": round(sum(values) / len(values) * 1000, 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+    }
+
+
+def summarize_plans(plans):
+    """Plan outcomes: without found plans, the plan/schedule timings only measure failure."""
+    found = [plan for plan in plans if plan["found"]]
+    return {
+        "found": len(found),
+        "none": len(plans) - len(found),
+        "proven_optimal": sum(1 for plan in found if plan["bound"] <= 1.0),
+        "mean_steps": round(sum(plan["steps"] for plan in found) / len(found), 2) if found else 0.0,
+    }
+
+
+def max_rss_mb():
+    """Peak resident set size of the calling process, in MB."""
+    # ru_maxrss is KB on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def peak_rss_mb(worker_rss):
+    """
+    Peak RSS of the driver, and the sum of every worker process's own peak.
+    (RUSAGE_CHILDREN only reports the largest single child, not the pool.)
+    In thread mode the workers are the driver process, so both are the same.
+    """
+    return round(max_rss_mb(), 1), round(sum(worker_rss.values()), 1)
+
+
+def run_load(corpus_dir, concurrency, rate, mode, role, requests, plan_budget, ga_generations, seed):
+    """
+    Open-loop load when rate > 0 (Poisson arrivals at `rate` req/s),
+    closed-loop otherwise (all requests queued at once).
+    Latency is measured from the scheduled arrival, so queueing delay counts.
+    """
+    pdfs = sorted(glob.glob(os.path.join(corpus_dir, "*.pdf")))
+    if not pdfs:
+        raise SystemExit(f"No PDFs found in {corpus_dir}. Run 'generate' first.")
+    requests = requests or len(pdfs)
+    rng = random.Random(seed)
+
+    pool_cls = ProcessPoolExecutor if mode == "process" else ThreadPoolExecutor
+
+    latencies, errors = [], 0
+    stage_times = {stage: [] for stage in STAGES}
+    plans = []
+    worker_rss = {}           # worker pid -> its own peak RSS (MB)
+
+    with pool_cls(max_workers=concurrency, initializer=init_worker, initargs=(role,)) as pool:
+        # Warm the workers so model loading is not billed to the first requests
+        start_all_workers(pool, mode, concurrency)
+
+        start = time.perf_counter()
+        arrival = start
+        pending = []
+        finished_at = {}
+        for i in range(requests):
+            if rate > 0:
+                arrival += rng.expovariate(rate)
+                delay = arrival - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            future = pool.submit(run_pipeline, pdfs[i % len(pdfs)], role, plan_budget, ga_generations)
+            future.add_done_callback(lambda f, i=i: finished_at.__setitem__(i, time.perf_counter()))
+            pending.append((i, arrival, future))
+
+        for i, scheduled, future in pending:
+            try:
+                timings, plan, (pid, rss) = future.result()
+            except Exception as e:
+                errors += 1
+                print(f"Request failed: {e}")
+                continue
+            latencies.append(finished_at[i] - scheduled)
+            for stage in STAGES:
+                stage_times[stage].append(timings[stage])
+            plans.append(plan)
+            worker_rss[pid] = max(rss, worker_rss.get(pid, 0.0))
+        elapsed = time.perf_counter() - start
+
+    rss_self, rss_workers = peak_rss_mb(worker_rss)
+    return {
+        "config": {
+            "corpus": os.path.abspath(corpus_dir), "concurrency": concurrency, "rate": rate,
+            "mode": mode, "role": role, "requests": requests, "plan_budget": plan_budget,
+            "ga_generations": ga_generations, "seed": seed,
+        },
+        "completed": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 3) if elapsed else 0.0,
+        "latency": summarize(latencies),
+        "stages": {stage: summarize(stage_times[stage]) for stage in STAGES},
+        "plans": summarize_plans(plans),
+        "peak_rss_mb": {"self": rss_self, "workers_sum": rss_workers, "workers": len(worker_rss)},
+    }
+
+
+# --- Reporting ---
+def _rows(report):
+    rows = [
+        ("throughput (req/s)", report["throughput_rps"]),
+        ("completed", report["completed"]),
+        ("errors", report["errors"]),
+    ]
+    for key in ("p50_ms", "p95_ms", "p99_ms", "mean_ms"):
+        rows.append((f"latency {key}", report["latency"][key]))
+    for stage in STAGES:
+        for key in ("p50_ms", "p95_ms"):
+            rows.append((f"{stage} {key}", report["stages"][stage][key]))
+    rows.append(("plans found", report["plans"]["found"]))
+    rows.append(("plans none", report["plans"]["none"]))
+    rows.append(("plans proven optimal", report["plans"]["proven_optimal"]))
+    rows.append(("plan mean steps", report["plans"]["mean_steps"]))
+    rows.append(("peak RSS self (MB)", report["peak_rss_mb"]["self"]))
+    rows.append(("peak RSS workers sum (MB)", report["peak_rss_mb"]["workers_sum"]))
+    return rows
+
+
+def print_report(report):
+    for name, value in _rows(report):
+        print(f"{name:<26}{value:>12}")
+
+
+def compare_reports(path_a, path_b):
+    with open(path_a) as f:
+        a = json.load(f)
+    with open(path_b) as f:
+        b = json.load(f)
+    print(f"{'metric':<26}{'A':>12}{'B':>12}{'change':>10}")
+    for (name, value_a), (_, value_b) in zip(_rows(a), _rows(b)):
+        change = f"{(value_b - value_a) / value_a * 100:+.1f}%" if value_a else "-"
+        print(f"{name:<26}{value_a:>12}{value_b:>12}{change:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end load test for the career agent pipeline.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="Create a synthetic resume PDF corpus")
+    gen.add_argument("--out", default="corpus")
+    gen.add_argument("--count", type=int, default=100)
+    gen.add_argument("--pages", default="1-2", help="Page count range, e.g. 1-3")
+    gen.add_argument("--density", type=float, default=0.3, help="Share of lines that mention skills")
+    gen.add_argument("--seed", type=int, default=42)
+    gen.add_argument("--role", default="Python Developer", help="Role the plannable resumes are written for")
+    gen.add_argument("--plannable", type=float, default=0.5,
+                     help="Share of resumes from which a plan to --role is reachable")
+
+    run = sub.add_parser("run", help="Drive the pipeline with a corpus")
+    run.add_argument("--corpus", default="corpus")
+    run.add_argument("--concurrency", type=int, default=4)
+    run.add_argument("--rate", type=float, default=0.0, help="Arrival rate in req/s (0 = closed loop)")
+    run.add_argument("--mode", choices=["thread", "process"], default="process")
+    run.add_argument("--role", default="Python Developer")
+    run.add_argument("--requests", type=int, default=0, help="Number of requests (default: corpus size)")
+    run.add_argument("--plan-budget", type=float, default=1.0, help="Planner time budget in seconds")
+    run.add_argument("--ga-generations", type=int, default=50)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--out", help="Save the report as JSON")
+
+    cmp_ = sub.add_parser("compare", help="Compare two saved reports side by side")
+    cmp_.add_argument("report_a")
+    cmp_.add_argument("report_b")
+
+    args = parser.parse_args()
+    if args.command == "generate":
+        low, _, high = args.pages.partition("-")
+        generate_corpus(args.out, args.count, (int(low), int(high or low)), args.density, args.seed,
+                        args.role, args.plannable)
+        print(f"Wrote {args.count} resumes to {args.out}")
+    elif args.command == "run":
+        report = run_load(args.corpus, args.concurrency, args.rate, args.mode, args.role, args.requests,
+                          args.plan_budget, args.ga_generations, args.seed)
+        print_report(report)
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump(report, f, indent=2)
+    else:
+        compare_reports(args.report_a, args.report_b)
+
+
+if __name__ == "__main__":
+    main()